@@ -12,7 +12,13 @@ bl_info = {
 import bpy
 import os
 import re
-from bpy.props import StringProperty, FloatProperty, BoolProperty, FloatVectorProperty, EnumProperty
+import json
+import hashlib
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from bpy.props import StringProperty, FloatProperty, BoolProperty, FloatVectorProperty, EnumProperty, IntProperty
 from bpy.types import Operator, Panel, PropertyGroup
 
 def ensure_stl_addon():
@@ -129,6 +135,38 @@ class VirtualEndoSettings(PropertyGroup):
         subtype='DIR_PATH',
         description="Ordner für die exportierte Datei"
     )
+    
+    progressive_export: BoolProperty(
+        name="Progressiver Export",
+        default=False,
+        description="Schreibt Pulp, Teeth und Bone als einzelne GLB-Dateien mit Index, damit Viewer Pulp und Zähne zuerst laden"
+    )
+    
+    skip_unchanged: BoolProperty(
+        name="Unveränderte Fälle überspringen",
+        default=True,
+        description="Überspringt Fälle, deren Manifest zu Eingabedateien und Einstellungen passt (ausschalten, um neu zu exportieren)"
+    )
+    
+    batch_folder: StringProperty(
+        name="Fallarchiv",
+        subtype='DIR_PATH',
+        description="Ordner mit je einem Unterordner pro Fall"
+    )
+    
+    prefetch_cases: IntProperty(
+        name="Vorladen (Fälle)",
+        default=2,
+        min=0, max=8,
+        description="Anzahl Fälle, die während der Verarbeitung im Hintergrund vorgeladen werden (0 = aus)"
+    )
+    
+    prefetch_limit_mb: IntProperty(
+        name="Vorlade-Limit (MB)",
+        default=1024,
+        min=16, max=65536,
+        description="Maximale Datenmenge vorgeladener STL-Dateien"
+    )
 
 def get_materials(settings):
     alpha_teeth = settings.alpha_teeth
@@ -182,6 +220,317 @@ def categorize_stl_files(folder_path):
     
     return files
 
+MANIFEST_VERSION = 1
+PROGRESSIVE_INDEX_VERSION = 1
+
+# Ladereihenfolge im progressiven Export: Pulp und Zähne vor dem großen Knochen
+PROGRESSIVE_PRIORITY = ["Pulp", "Teeth", "Bone"]
+
+def use_progressive_export(settings):
+    """Progressiver Export ist nur für GLB verfügbar"""
+    return settings.export_format == 'GLB' and settings.progressive_export
+
+def get_export_name(settings):
+    """Liefert den Dateinamen der (Haupt-)Exportdatei"""
+    if use_progressive_export(settings):
+        return "VirtualEndo_Export.json"
+    return f"VirtualEndo_Export.{settings.export_format.lower()}"
+
+def get_export_path(output_dir, settings):
+    """Liefert den Pfad der Exportdatei für das gewählte Format"""
+    return os.path.join(output_dir, get_export_name(settings))
+
+def get_progressive_chunk_path(output_dir, category):
+    """Liefert den Pfad der GLB-Teildatei einer Kategorie"""
+    return os.path.join(output_dir, f"VirtualEndo_Export_{category.lower()}.glb")
+
+def get_manifest_path(export_path):
+    """Liefert den Pfad des Manifests neben der Exportdatei"""
+    return export_path + ".manifest.json"
+
+def hash_file(filepath, chunk_size=1024 * 1024):
+    """Berechnet den SHA-256-Hash einer Datei"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_settings_snapshot(settings):
+    """Sammelt alle Einstellungen, die das Exportergebnis beeinflussen"""
+    return {
+        "alpha_teeth": float(settings.alpha_teeth),
+        "alpha_bone": float(settings.alpha_bone),
+        "color_pulp": [float(c) for c in settings.color_pulp],
+        "color_teeth": [float(c) for c in settings.color_teeth],
+        "color_bone": [float(c) for c in settings.color_bone],
+        "scale_factor": float(settings.scale_factor),
+        "smooth_shading": bool(settings.smooth_shading),
+        "center_objects": bool(settings.center_objects),
+        "export_format": settings.export_format,
+        "progressive_export": use_progressive_export(settings)
+    }
+
+def get_known_input(known_inputs, filename, stat):
+    """Liefert einen bekannten Eintrag nur, wenn Größe und Zeitstempel noch passen"""
+    entry = (known_inputs or {}).get(filename)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+        return entry
+    return None
+
+def snapshot_inputs(files, known_inputs=None):
+    """Erfasst Größe, Zeitstempel und Hash aller Eingabedateien vor dem Import
+    
+    Bekannte Einträge (z.B. aus der Manifestprüfung) werden übernommen, solange
+    Größe und Zeitstempel unverändert sind; sonst wird die Datei neu gehasht.
+    """
+    inputs = {}
+    for file_list in files.values():
+        for filepath, filename in file_list:
+            stat = os.stat(filepath)
+            entry = get_known_input(known_inputs, filename, stat)
+            if entry is None:
+                entry = {
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "sha256": hash_file(filepath)
+                }
+            inputs[filename] = dict(entry)
+    return inputs
+
+def build_manifest(inputs, settings, outputs):
+    """Erstellt das Manifest aus dem vor dem Import erfassten Eingabestand"""
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "addon_version": list(bl_info["version"]),
+        "settings": get_settings_snapshot(settings),
+        "inputs": inputs,
+        "outputs": [os.path.basename(path) for path in outputs]
+    }
+
+def load_manifest(manifest_path):
+    """Lädt ein Manifest, gibt bei fehlender oder defekter Datei None zurück"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_manifest(manifest_path, manifest):
+    """Schreibt das Manifest atomar neben die Exportdatei"""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def is_case_up_to_date(manifest_path, files, settings, known_inputs=None, allow_hashing=True):
+    """Prüft, ob der vorhandene Export noch zu Eingaben und Einstellungen passt
+    
+    Dateien mit gleicher Größe und gleichem Zeitstempel gelten als unverändert.
+    Weicht nur der Zeitstempel ab, entscheidet der Hash; das Manifest wird dann
+    mit den neuen Zeitstempeln aktualisiert. known_inputs enthält bereits
+    bekannte Einträge (size, mtime, sha256) und wird um neu berechnete ergänzt,
+    mit allow_hashing=False wird nichts gelesen.
+    """
+    manifest = load_manifest(manifest_path)
+    if not manifest:
+        return False
+    
+    if manifest.get("manifest_version") != MANIFEST_VERSION:
+        return False
+    if manifest.get("addon_version") != list(bl_info["version"]):
+        return False
+    if manifest.get("settings") != get_settings_snapshot(settings):
+        return False
+    
+    output_dir = os.path.dirname(manifest_path)
+    outputs = manifest.get("outputs") or []
+    if not outputs:
+        return False
+    for name in outputs:
+        if not os.path.exists(os.path.join(output_dir, name)):
+            return False
+    
+    recorded = manifest.get("inputs") or {}
+    current = {filename: filepath for file_list in files.values() for filepath, filename in file_list}
+    if set(recorded) != set(current):
+        return False
+    
+    touched = False
+    for filename, filepath in current.items():
+        entry = recorded[filename]
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        
+        if stat.st_size != entry.get("size"):
+            return False
+        if stat.st_mtime == entry.get("mtime"):
+            continue
+        
+        known = get_known_input(known_inputs, filename, stat)
+        if known is None:
+            if not allow_hashing:
+                return False
+            known = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": hash_file(filepath)}
+            if known_inputs is not None:
+                known_inputs[filename] = known
+        if known["sha256"] != entry.get("sha256"):
+            return False
+        
+        entry["mtime"] = stat.st_mtime
+        touched = True
+    
+    if touched:
+        try:
+            write_manifest(manifest_path, manifest)
+        except OSError as e:
+            print(f"Manifest konnte nicht aktualisiert werden: {e}")
+    
+    return True
+
+def find_case_folders(archive_folder):
+    """Sucht alle Unterordner des Archivs, die VirtualEndo STL-Dateien enthalten"""
+    cases = []
+    
+    if not os.path.isdir(archive_folder):
+        return cases
+    
+    for name in sorted(os.listdir(archive_folder)):
+        case_folder = os.path.join(archive_folder, name)
+        if not os.path.isdir(case_folder):
+            continue
+        files = categorize_stl_files(case_folder)
+        if any(files.values()):
+            cases.append(case_folder)
+    
+    return cases
+
+def stage_case_files(files, staging_dir, chunk_size=1024 * 1024, max_attempts=3):
+    """Kopiert die STL-Dateien eines Falls in ein lokales Verzeichnis und hasht sie dabei
+    
+    Größe und Zeitstempel der Quelle werden vor und nach dem Kopieren gelesen;
+    ändert sich die Datei währenddessen, wird erneut kopiert. Gibt die Dateiliste
+    mit den lokalen Pfaden und je Dateiname den Stand der Quelle (size, mtime,
+    sha256) zurück, der genau zur lokalen Kopie passt.
+    """
+    os.makedirs(staging_dir, exist_ok=True)
+    staged_files = {category: [] for category in files}
+    inputs = {}
+    
+    for category, file_list in files.items():
+        for filepath, filename in file_list:
+            staged_path = os.path.join(staging_dir, filename)
+            
+            for attempt in range(max_attempts):
+                before = os.stat(filepath)
+                digest = hashlib.sha256()
+                with open(filepath, 'rb') as src, open(staged_path, 'wb') as dst:
+                    for chunk in iter(lambda: src.read(chunk_size), b''):
+                        digest.update(chunk)
+                        dst.write(chunk)
+                after = os.stat(filepath)
+                
+                if (before.st_size, before.st_mtime) == (after.st_size, after.st_mtime):
+                    break
+            else:
+                raise OSError(f"{filename} ändert sich während des Vorladens")
+            
+            staged_files[category].append((staged_path, filename))
+            inputs[filename] = {
+                "size": after.st_size,
+                "mtime": after.st_mtime,
+                "sha256": digest.hexdigest()
+            }
+    
+    return staged_files, inputs
+
+class CasePrefetcher:
+    """Lädt die STL-Dateien kommender Fälle im Hintergrund vor
+    
+    Blender-Operatoren sind nicht threadsicher, daher übernehmen die Hintergrund-
+    Threads nur Lesen, Hashen und Kopieren in ein lokales Zwischenverzeichnis.
+    Import und Export laufen weiter im Hauptthread, während die nächsten Fälle
+    schon geladen werden. Anzahl und Datenmenge vorgeladener Fälle sind begrenzt.
+    """
+    
+    def __init__(self, case_folders, max_pending=2, max_bytes=1024 * 1024 * 1024):
+        self.case_folders = list(case_folders)
+        self.max_pending = max(1, max_pending)
+        self.max_bytes = max_bytes
+        self.staging_root = None
+        self.executor = None
+        self.pending = deque()
+        self.next_index = 0
+        self.staged_bytes = 0
+        self.case_files = {}
+    
+    def __enter__(self):
+        self.staging_root = tempfile.mkdtemp(prefix="virtualendo_prefetch_")
+        self.executor = ThreadPoolExecutor(max_workers=self.max_pending)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self.staging_root, ignore_errors=True)
+        return False
+    
+    def __iter__(self):
+        self.fill()
+        while self.pending:
+            case = self.pending.popleft()
+            result = case["future"].result()
+            
+            # Nächste Fälle laden, während dieser Fall verarbeitet wird
+            self.fill()
+            yield result
+            
+            shutil.rmtree(case["staging_dir"], ignore_errors=True)
+            self.staged_bytes -= case["size"]
+            self.fill()
+    
+    def get_case_files(self, index):
+        """Kategorisiert einen Fall einmalig und merkt sich Dateien und Gesamtgröße"""
+        if index not in self.case_files:
+            files = categorize_stl_files(self.case_folders[index])
+            size = 0
+            for file_list in files.values():
+                for filepath, filename in file_list:
+                    try:
+                        size += os.path.getsize(filepath)
+                    except OSError:
+                        pass
+            self.case_files[index] = (files, size)
+        return self.case_files[index]
+    
+    def fill(self):
+        """Plant weitere Fälle ein, solange Warteschlange und Datenlimit es erlauben"""
+        while self.next_index < len(self.case_folders) and len(self.pending) < self.max_pending:
+            files, size = self.get_case_files(self.next_index)
+            
+            # Ein einzelner zu großer Fall wird nur geladen, wenn sonst nichts ansteht
+            if self.staged_bytes > 0 and self.staged_bytes + size > self.max_bytes:
+                break
+            
+            case_folder = self.case_folders[self.next_index]
+            staging_dir = os.path.join(self.staging_root, f"{self.next_index:05d}")
+            future = self.executor.submit(self.load_case, case_folder, files, staging_dir)
+            
+            self.pending.append({"future": future, "staging_dir": staging_dir, "size": size})
+            self.staged_bytes += size
+            del self.case_files[self.next_index]
+            self.next_index += 1
+    
+    def load_case(self, case_folder, files, staging_dir):
+        """Läuft im Hintergrund-Thread, Fehler werden im Ergebnis zurückgegeben"""
+        result = {"case_folder": case_folder, "files": None, "inputs": None, "error": None}
+        try:
+            result["files"], result["inputs"] = stage_case_files(files, staging_dir)
+        except Exception as e:
+            result["error"] = str(e)
+        return result
+
 class VIRTUALENDO_OT_enable_stl(Operator):
     bl_idname = "virtualendo.enable_stl"
     bl_label = "STL Add-on aktivieren"
@@ -296,107 +645,161 @@ class VIRTUALENDO_OT_convert_to_ar(Operator):
         else:
             output_dir = settings.input_folder
         
+        result = self.convert_case(settings, settings.input_folder, output_dir,
+                                   skip_unchanged=settings.skip_unchanged)
+        if result == 'FAILED':
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def convert_case(self, settings, input_folder, output_dir, import_files=None, known_inputs=None,
+                     keep_objects=True, skip_unchanged=False):
+        """Konvertiert einen Fallordner, gibt 'CONVERTED', 'SKIPPED' oder 'FAILED' zurück
+        
+        import_files kann auf vorgeladene lokale Kopien der STL-Dateien zeigen,
+        known_inputs enthält dann deren beim Kopieren erfassten Stand.
+        Mit keep_objects=False werden die importierten Objekte danach entfernt,
+        mit skip_unchanged=True werden Fälle mit passendem Manifest übersprungen.
+        """
         # STL-Dateien kategorisieren
-        files = categorize_stl_files(settings.input_folder)
+        files = categorize_stl_files(input_folder)
         total_files = sum(len(file_list) for file_list in files.values())
         
         if total_files == 0:
             self.report({'ERROR'}, "Keine passenden STL-Dateien gefunden!")
-            return {'CANCELLED'}
+            return 'FAILED'
+        
+        export_path = get_export_path(output_dir, settings)
+        manifest_path = get_manifest_path(export_path)
+        
+        # Unveränderte Fälle überspringen
+        staged_inputs = known_inputs or {}
+        known_inputs = dict(staged_inputs)
+        if skip_unchanged and is_case_up_to_date(manifest_path, files, settings, known_inputs):
+            self.report({'INFO'}, f"Unverändert, übersprungen: {export_path}")
+            return 'SKIPPED'
+        
+        # Eingabestand vor dem Import festhalten, damit das Manifest genau
+        # die exportierten Daten beschreibt
+        try:
+            inputs = snapshot_inputs(files, known_inputs)
+        except OSError as e:
+            self.report({'ERROR'}, f"Eingabedateien nicht lesbar: {str(e)}")
+            return 'FAILED'
+        
+        # Vorgeladene Kopien nur verwenden, wenn sie genau dem erfassten Stand entsprechen
+        if import_files and inputs != staged_inputs:
+            self.report({'INFO'}, "Quelldateien seit dem Vorladen geändert, lese direkt")
+            import_files = None
         
         # Import und Verarbeitung
         materials = get_materials(settings)
         imported_objects = []
+        category_objects = {}
         
-        # Szene aufräumen
-        self.report({'INFO'}, "Räume Szene auf...")
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        try:
+            # Szene aufräumen
+            self.report({'INFO'}, "Räume Szene auf...")
+            bpy.ops.object.select_all(action='SELECT')
+            bpy.ops.object.delete(use_global=False)
 
-        # Import aller Kategorien
-        for category, file_list in files.items():
-            if not file_list:
-                continue
-                
-            material_settings = materials.get(category)
-            if not material_settings:
-                continue
-                
-            mat = self.create_material(category, material_settings)
-            self.report({'INFO'}, f"Importiere {len(file_list)} {category} Dateien...")
-
-            for filepath, filename in file_list:
-                try:
-                    result = bpy.ops.import_mesh.stl(filepath=filepath)
-                    if result == {'FINISHED'}:
-                        obj = bpy.context.active_object
-                        if obj and obj.type == 'MESH':
-                            obj.data.materials.clear()
-                            obj.data.materials.append(mat)
-                            
-                            clean_name = filename[:-4] if filename.endswith('.stl') else filename
-                            obj.name = f"{category}_{clean_name}"
-                            
-                            imported_objects.append(obj)
-                            self.report({'INFO'}, f"Importiert: {filename}")
-                except Exception as e:
-                    self.report({'ERROR'}, f"Fehler bei {filename}: {str(e)}")
-
-        if not imported_objects:
-            self.report({'ERROR'}, "Keine STL-Dateien erfolgreich importiert!")
-            return {'CANCELLED'}
+            # Import aller Kategorien
+            for category, file_list in (import_files or files).items():
+                if not file_list:
+                    continue
+                    
+                material_settings = materials.get(category)
+                if not material_settings:
+                    continue
+                    
+                mat = self.create_material(category, material_settings)
+                self.report({'INFO'}, f"Importiere {len(file_list)} {category} Dateien...")
 
-        # Objektverarbeitung
-        self.report({'INFO'}, f"Verarbeite {len(imported_objects)} Objekte...")
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in imported_objects:
-            obj.select_set(True)
-        
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-        
-        for obj in imported_objects:
-            if settings.center_objects:
-                obj.location = (0, 0, 0)
-            else:
-                obj.location = (-0.1, -0.1, 0.08)
-                
-            obj.scale = (settings.scale_factor, settings.scale_factor, settings.scale_factor)
+                for filepath, filename in file_list:
+                    try:
+                        result = bpy.ops.import_mesh.stl(filepath=filepath)
+                        if result == {'FINISHED'}:
+                            obj = bpy.context.active_object
+                            if obj and obj.type == 'MESH':
+                                obj.data.materials.clear()
+                                obj.data.materials.append(mat)
+                                
+                                clean_name = filename[:-4] if filename.endswith('.stl') else filename
+                                obj.name = f"{category}_{clean_name}"
+                                
+                                imported_objects.append(obj)
+                                category_objects.setdefault(category, []).append(obj)
+                                self.report({'INFO'}, f"Importiert: {filename}")
+                    except Exception as e:
+                        self.report({'ERROR'}, f"Fehler bei {filename}: {str(e)}")
+
+            if not imported_objects:
+                self.report({'ERROR'}, "Keine STL-Dateien erfolgreich importiert!")
+                return 'FAILED'
+
+            # Objektverarbeitung
+            self.report({'INFO'}, f"Verarbeite {len(imported_objects)} Objekte...")
+            
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in imported_objects:
+                obj.select_set(True)
+            
+            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
             
-            if settings.smooth_shading:
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.shade_smooth()
+            for obj in imported_objects:
+                if settings.center_objects:
+                    obj.location = (0, 0, 0)
+                else:
+                    obj.location = (-0.1, -0.1, 0.08)
+                    
+                obj.scale = (settings.scale_factor, settings.scale_factor, settings.scale_factor)
+                
+                if settings.smooth_shading:
+                    bpy.context.view_layer.objects.active = obj
+                    bpy.ops.object.shade_smooth()
 
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        
-        # Export
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in imported_objects:
-            obj.select_set(True)
-        
-        # Export durchführen
-        if settings.export_format == 'USDZ':
-            export_path = os.path.join(output_dir, "VirtualEndo_Export.usdz")
-            success = self.do_usdz_export(export_path)
-        elif settings.export_format == 'GLB':
-            export_path = os.path.join(output_dir, "VirtualEndo_Export.glb")
-            success = self.do_glb_export(export_path)
-        elif settings.export_format == 'FBX':
-            export_path = os.path.join(output_dir, "VirtualEndo_Export.fbx")
-            success = self.do_fbx_export(export_path)
-        else:  # STL
-            export_path = os.path.join(output_dir, "VirtualEndo_Export.stl")
-            success = self.do_stl_export(export_path)
-        
-        if success:
+            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+            
+            # Export
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in imported_objects:
+                obj.select_set(True)
+            
+            # Export durchführen
+            outputs = [export_path]
+            if use_progressive_export(settings):
+                chunk_paths = self.do_progressive_glb_export(export_path, category_objects)
+                success = chunk_paths is not None
+                if success:
+                    outputs.extend(chunk_paths)
+            elif settings.export_format == 'USDZ':
+                success = self.do_usdz_export(export_path)
+            elif settings.export_format == 'GLB':
+                success = self.do_glb_export(export_path)
+            elif settings.export_format == 'FBX':
+                success = self.do_fbx_export(export_path)
+            else:  # STL
+                success = self.do_stl_export(export_path)
+            
+            if not success:
+                self.report({'ERROR'}, "Export fehlgeschlagen!")
+                return 'FAILED'
+            
             file_size = os.path.getsize(export_path)
             filename = os.path.basename(export_path)
             self.report({'INFO'}, f"Erfolgreich erstellt: {filename} ({file_size} Bytes)")
             self.report({'INFO'}, f"Speicherort: {export_path}")
-            return {'FINISHED'}
-        else:
-            self.report({'ERROR'}, "Export fehlgeschlagen!")
-            return {'CANCELLED'}
+            
+            # Manifest für spätere inkrementelle Läufe schreiben
+            try:
+                write_manifest(manifest_path, build_manifest(inputs, settings, outputs))
+            except OSError as e:
+                self.report({'WARNING'}, f"Manifest konnte nicht geschrieben werden: {str(e)}")
+            
+            return 'CONVERTED'
+        finally:
+            # Im Stapelbetrieb Objekte und Meshes jedes Falls wieder freigeben
+            if not keep_objects:
+                self.remove_objects(imported_objects)
 
     def do_usdz_export(self, filepath):
         """Exportiert als USDZ-Datei"""
@@ -434,6 +837,73 @@ class VIRTUALENDO_OT_convert_to_ar(Operator):
             self.report({'ERROR'}, f"GLB Export fehlgeschlagen: {str(e)}")
             return False
 
+    def do_progressive_glb_export(self, index_path, category_objects):
+        """Exportiert jede Kategorie als eigene GLB-Datei und schreibt einen Index
+        
+        Der Index listet die Teildateien in Ladereihenfolge, sodass ein Viewer
+        Pulp und Zähne darstellen kann, bevor der Knochen geladen ist.
+        Gibt die Pfade der Teildateien zurück oder None bei Fehlern.
+        """
+        output_dir = os.path.dirname(index_path)
+        chunk_paths = []
+        assets = []
+        
+        for priority, category in enumerate(PROGRESSIVE_PRIORITY):
+            objects = category_objects.get(category)
+            if not objects:
+                continue
+            
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in objects:
+                obj.select_set(True)
+            
+            chunk_path = get_progressive_chunk_path(output_dir, category)
+            if not self.do_glb_export(chunk_path):
+                self.report({'ERROR'}, f"{category} Teildatei konnte nicht exportiert werden")
+                return None
+            
+            chunk_size = os.path.getsize(chunk_path)
+            self.report({'INFO'}, f"Teildatei erstellt: {os.path.basename(chunk_path)} ({chunk_size} Bytes)")
+            
+            chunk_paths.append(chunk_path)
+            assets.append({
+                "category": category,
+                "priority": priority,
+                "uri": os.path.basename(chunk_path),
+                "size": chunk_size,
+                "objects": [obj.name for obj in objects]
+            })
+        
+        if not assets:
+            self.report({'ERROR'}, "Keine Objekte für den progressiven Export")
+            return None
+        
+        index = {
+            "format": "VirtualEndo progressive",
+            "version": PROGRESSIVE_INDEX_VERSION,
+            "assets": assets
+        }
+        
+        try:
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+        except OSError as e:
+            self.report({'ERROR'}, f"Index konnte nicht geschrieben werden: {str(e)}")
+            return None
+        
+        # Teildateien früherer Läufe entfernen, deren Kategorie nicht mehr vorkommt
+        for category in PROGRESSIVE_PRIORITY:
+            chunk_path = get_progressive_chunk_path(output_dir, category)
+            if chunk_path in chunk_paths or not os.path.exists(chunk_path):
+                continue
+            try:
+                os.remove(chunk_path)
+                self.report({'INFO'}, f"Veraltete Teildatei entfernt: {os.path.basename(chunk_path)}")
+            except OSError as e:
+                self.report({'WARNING'}, f"Veraltete Teildatei nicht entfernbar: {str(e)}")
+        
+        return chunk_paths
+
     def do_fbx_export(self, filepath):
         """Exportiert als FBX-Datei - Korrigierte Version"""
         try:
@@ -497,9 +967,21 @@ class VIRTUALENDO_OT_convert_to_ar(Operator):
             self.report({'ERROR'}, f"STL Export fehlgeschlagen: {str(e)}")
             return False
 
+    def remove_objects(self, objects):
+        """Entfernt Objekte samt ihrer nicht mehr verwendeten Meshes aus bpy.data"""
+        for obj in objects:
+            mesh = obj.data
+            bpy.data.objects.remove(obj, do_unlink=True)
+            if mesh and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
     def create_material(self, name, material_settings):
-        """Erstellt ein Material mit den gegebenen Einstellungen"""
-        mat = bpy.data.materials.new(name)
+        """Erstellt ein Material mit den gegebenen Einstellungen
+        
+        Ein vorhandenes Material gleichen Namens wird neu aufgebaut statt
+        dupliziert, damit im Export keine Namen wie Pulp.001 auftauchen.
+        """
+        mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
@@ -534,9 +1016,98 @@ class VIRTUALENDO_OT_convert_to_ar(Operator):
                     mat.shadow_method = 'HASHED'
             except:
                 pass
+        else:
+            mat.blend_method = 'OPAQUE'
+            try:
+                if hasattr(mat, "shadow_method"):
+                    mat.shadow_method = 'OPAQUE'
+            except:
+                pass
         
         return mat
 
+class VIRTUALENDO_OT_batch_convert(VIRTUALENDO_OT_convert_to_ar):
+    bl_idname = "virtualendo.batch_convert"
+    bl_label = "Archiv konvertieren"
+    bl_description = "Konvertiert jeden Fallordner im Archiv, unveränderte Fälle werden übersprungen"
+    
+    def execute(self, context):
+        settings = context.scene.virtualendo_settings
+        
+        # STL-Addon prüfen und aktivieren
+        if not hasattr(bpy.ops.import_mesh, 'stl'):
+            self.report({'INFO'}, "Aktiviere STL-Addon...")
+            if not ensure_stl_addon() and not force_enable_stl():
+                self.report({'ERROR'}, "STL Import konnte nicht aktiviert werden!")
+                return {'CANCELLED'}
+        
+        if not settings.batch_folder or not os.path.isdir(settings.batch_folder):
+            self.report({'ERROR'}, "Ungültiger Archivordner!")
+            return {'CANCELLED'}
+        
+        if settings.use_custom_output and settings.output_folder:
+            if not os.path.exists(settings.output_folder):
+                self.report({'ERROR'}, f"Ausgabeordner existiert nicht: {settings.output_folder}")
+                return {'CANCELLED'}
+        
+        case_folders = find_case_folders(settings.batch_folder)
+        if not case_folders:
+            self.report({'WARNING'}, "Keine Fallordner mit passenden STL-Dateien gefunden!")
+            return {'CANCELLED'}
+        
+        counts = {'CONVERTED': 0, 'SKIPPED': 0, 'FAILED': 0}
+        
+        # Unveränderte Fälle vorab per Zeitstempel aussortieren, damit sie nicht vorgeladen werden
+        pending_cases = []
+        for case_folder in case_folders:
+            if settings.skip_unchanged:
+                export_path = get_export_path(self.get_case_output_dir(settings, case_folder), settings)
+                files = categorize_stl_files(case_folder)
+                if is_case_up_to_date(get_manifest_path(export_path), files, settings, allow_hashing=False):
+                    self.report({'INFO'}, f"Unverändert, übersprungen: {export_path}")
+                    counts['SKIPPED'] += 1
+                    continue
+            pending_cases.append(case_folder)
+        
+        if settings.prefetch_cases > 0 and len(pending_cases) > 1:
+            max_bytes = settings.prefetch_limit_mb * 1024 * 1024
+            with CasePrefetcher(pending_cases, settings.prefetch_cases, max_bytes) as prefetcher:
+                for index, case in enumerate(prefetcher, start=1):
+                    if case["error"]:
+                        self.report({'WARNING'}, f"Vorladen fehlgeschlagen, lese direkt: {case['error']}")
+                    result = self.convert_batch_case(settings, case["case_folder"], index, len(pending_cases),
+                                                     case["files"], case["inputs"])
+                    counts[result] += 1
+        else:
+            for index, case_folder in enumerate(pending_cases, start=1):
+                result = self.convert_batch_case(settings, case_folder, index, len(pending_cases))
+                counts[result] += 1
+        
+        self.report({'INFO'}, f"Archiv fertig: {counts['CONVERTED']} konvertiert, "
+                              f"{counts['SKIPPED']} übersprungen, {counts['FAILED']} fehlgeschlagen")
+        return {'FINISHED'}
+    
+    def get_case_output_dir(self, settings, case_folder):
+        """Bei eigenem Ausgabeordner erhält jeder Fall einen Unterordner"""
+        if settings.use_custom_output and settings.output_folder:
+            case_name = os.path.basename(os.path.normpath(case_folder))
+            return os.path.join(settings.output_folder, case_name)
+        return case_folder
+    
+    def convert_batch_case(self, settings, case_folder, index, total, import_files=None, known_inputs=None):
+        """Konvertiert einen Fall des Archivs und fängt Fehler ab"""
+        case_name = os.path.basename(os.path.normpath(case_folder))
+        self.report({'INFO'}, f"Fall {index}/{total}: {case_name}")
+        
+        try:
+            output_dir = self.get_case_output_dir(settings, case_folder)
+            os.makedirs(output_dir, exist_ok=True)
+            return self.convert_case(settings, case_folder, output_dir, import_files, known_inputs,
+                                     keep_objects=False, skip_unchanged=settings.skip_unchanged)
+        except Exception as e:
+            self.report({'ERROR'}, f"Fehler bei Fall {case_name}: {str(e)}")
+            return 'FAILED'
+
 class VirtualEndoPanel(Panel):
     bl_label = "VirtualEndo"
     bl_idname = "PT_VirtualEndo"
@@ -629,6 +1200,9 @@ class VirtualEndoPanel(Panel):
         elif settings.export_format == 'GLB':
             info_box = box.box()
             info_box.label(text="GLB: Universell kompatibel", icon='INFO')
+            box.prop(settings, "progressive_export")
+            if settings.progressive_export:
+                info_box.label(text="Pulp, Teeth und Bone als einzelne GLB-Dateien")
         elif settings.export_format == 'FBX':
             info_box = box.box()
             info_box.label(text="FBX: Autodesk Standard", icon='INFO')
@@ -647,6 +1221,8 @@ class VirtualEndoPanel(Panel):
         else:
             box.label(text="Ausgabe im Eingabeordner", icon='INFO')
         
+        box.prop(settings, "skip_unchanged")
+        
         # Konvertierung
         box = layout.box()
         box.label(text="Konvertierung:", icon='PLAY')
@@ -654,7 +1230,7 @@ class VirtualEndoPanel(Panel):
         row = box.row()
         row.scale_y = 1.5
         
-        button_text = f"Zu VirtualEndo_Export.{settings.export_format.lower()} konvertieren"
+        button_text = f"Zu {get_export_name(settings)} konvertieren"
         op = row.operator("virtualendo.convert_to_ar", text=button_text, icon='EXPORT')
         
         button_enabled = bool(settings.input_folder)
@@ -675,9 +1251,25 @@ class VirtualEndoPanel(Panel):
             else:
                 output_dir = settings.input_folder
             
-            output_name = f"VirtualEndo_Export.{settings.export_format.lower()}"
+            output_name = get_export_name(settings)
             layout.label(text=f"Ausgabe: {output_name}", icon='INFO')
             layout.label(text=f"in: {os.path.basename(output_dir)}/", icon='FOLDER_REDIRECT')
+        
+        # Stapelverarbeitung
+        box = layout.box()
+        box.label(text="Stapelverarbeitung:", icon='FILE_FOLDER')
+        box.prop(settings, "batch_folder", text="")
+        
+        col = box.column(align=True)
+        col.prop(settings, "prefetch_cases")
+        col.prop(settings, "prefetch_limit_mb")
+        
+        row = box.row()
+        row.operator("virtualendo.batch_convert", text="Alle Fälle konvertieren", icon='EXPORT')
+        row.enabled = bool(settings.batch_folder)
+        
+        if settings.use_custom_output and settings.output_folder:
+            box.label(text="Ausgabe je Fall in Unterordnern", icon='INFO')
 
 def register():
     print("Registriere VirtualEndo Add-on v2.1.1")
@@ -690,6 +1282,7 @@ def register():
     bpy.utils.register_class(VIRTUALENDO_OT_enable_stl)
     bpy.utils.register_class(VIRTUALENDO_OT_scan_files)
     bpy.utils.register_class(VIRTUALENDO_OT_convert_to_ar)
+    bpy.utils.register_class(VIRTUALENDO_OT_batch_convert)
     bpy.utils.register_class(VirtualEndoPanel)
     print("VirtualEndo Add-on v2.1.1 erfolgreich registriert")
 
@@ -701,6 +1294,7 @@ def unregister():
     bpy.utils.unregister_class(VIRTUALENDO_OT_enable_stl)
     bpy.utils.unregister_class(VIRTUALENDO_OT_scan_files)
     bpy.utils.unregister_class(VIRTUALENDO_OT_convert_to_ar)
+    bpy.utils.unregister_class(VIRTUALENDO_OT_batch_convert)
     bpy.utils.unregister_class(VirtualEndoPanel)
     print("VirtualEndo Add-on v2.1.1 erfolgreich deregistriert")
 